@@ -4,10 +4,25 @@
 и данных пользователей.
 """
 
+import threading
+import time
 from typing import Dict, List, Optional, Tuple
-from urllib.parse import quote
 
-import requests
+import httpx
+import orjson
+
+# ijson — опциональная зависимость: позволяет разбирать крупные ответы
+# public-settings потоково, не строя всё дерево JSON в памяти
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+# Ошибки разбора JSON, которые оборачиваются в YandexAPIError
+if ijson is not None:
+    _JSON_DECODE_ERRORS = (orjson.JSONDecodeError, ijson.JSONError)
+else:
+    _JSON_DECODE_ERRORS = (orjson.JSONDecodeError,)
 
 
 class YandexAPIError(Exception):
@@ -15,6 +30,29 @@ class YandexAPIError(Exception):
     pass
 
 
+class _ChunkReader:
+    """Файлоподобная обёртка над итератором байтовых чанков для ijson."""
+
+    def __init__(self, chunks):
+        self._chunks = iter(chunks)
+        self._buffer = b""
+
+    def read(self, size: int = -1) -> bytes:
+        if size < 0:
+            data = self._buffer + b"".join(self._chunks)
+            self._buffer = b""
+            return data
+
+        while len(self._buffer) < size:
+            try:
+                self._buffer += next(self._chunks)
+            except StopIteration:
+                break
+
+        data, self._buffer = self._buffer[:size], self._buffer[size:]
+        return data
+
+
 class YandexAPIClient:
     """Клиент для работы с Яндекс 360 API."""
 
@@ -24,8 +62,25 @@ class YandexAPIClient:
 
     # Требуемые scope для работы приложения
     REQUIRED_SCOPES = {
-        "disk": ["cloud_api:disk.read", "cloud_api:disk.write"],
-        "users": ["directory:read_users", "directory:write_users"],
+        "disk": frozenset({"cloud_api:disk.read", "cloud_api:disk.write"}),
+        "users": frozenset({"directory:read_users", "directory:write_users"}),
+    }
+
+    # Максимальный размер кэшей ответов API
+    MAX_CACHE_SIZE = 256
+
+    # Повторы при временных ошибках сервера: httpx-транспорт повторяет
+    # только сбои установления соединения, повтор по кодам состояния
+    # с нарастающей задержкой реализован в _get_with_retry
+    RETRY_STATUSES = frozenset({502, 503, 504})
+    RETRY_TOTAL = 2
+    RETRY_BACKOFF = 0.2
+
+    # Общие заголовки всех экземпляров клиента;
+    # словарь создаётся один раз при загрузке класса
+    _BASE_HEADERS = {
+        "Content-Type": "application/json",
+        "Accept-Encoding": "gzip, deflate",
     }
 
     def __init__(self, token: str):
@@ -36,11 +91,21 @@ class YandexAPIClient:
             token: OAuth токен для доступа к API
         """
         self.token = token
-        self.session = requests.Session()
-        self.session.headers.update({
-            "Authorization": f"OAuth {token}",
-            "Content-Type": "application/json",
-        })
+
+        # HTTP/2-клиент: запросы к одному хосту (whoami и users/{uid})
+        # мультиплексируются по единственному TLS-соединению; транспорт
+        # повторяет запрос при сбое установления соединения
+        self._client = httpx.Client(
+            http2=True,
+            headers={**self._BASE_HEADERS, "Authorization": f"OAuth {token}"},
+            timeout=30.0,
+            limits=httpx.Limits(max_connections=10, max_keepalive_connections=10),
+            transport=httpx.HTTPTransport(retries=2),
+        )
+
+        # Кэши ответов API: повторные запросы по тому же ключу не ходят в сеть
+        self._user_cache: Dict[Tuple[int, int], Dict] = {}
+        self._owner_cache: Dict[str, Tuple[int, int]] = {}
 
     def whoami(self) -> Dict:
         """
@@ -55,11 +120,13 @@ class YandexAPIClient:
         url = f"{self.DIRECTORY_API_BASE}/whoami"
 
         try:
-            response = self.session.get(url)
+            response = self._get_with_retry(url)
             response.raise_for_status()
-            return response.json()
-        except requests.exceptions.RequestException as e:
+            return orjson.loads(response.content)
+        except httpx.HTTPError as e:
             raise YandexAPIError(f"Ошибка при вызове whoami: {e}")
+        except _JSON_DECODE_ERRORS as e:
+            raise YandexAPIError(f"Некорректный JSON в ответе whoami: {e}")
 
     def validate_scopes(self, scopes: List[str]) -> Tuple[bool, List[str]]:
         """
@@ -77,26 +144,15 @@ class YandexAPIClient:
         scopes_set = set(scopes)
         missing_scopes = []
 
-        # Проверка disk scope
-        has_disk = False
-        for scope in self.REQUIRED_SCOPES["disk"]:
-            if scope in scopes_set:
-                has_disk = True
-                break
-        if not has_disk:
+        # Достаточно одного scope из каждой группы: пересечение множеств
+        # выполняется одной операцией на уровне C
+        if not (self.REQUIRED_SCOPES["disk"] & scopes_set):
             missing_scopes.append("cloud_api:disk.read")
 
-        # Проверка users scope
-        has_users = False
-        for scope in self.REQUIRED_SCOPES["users"]:
-            if scope in scopes_set:
-                has_users = True
-                break
-        if not has_users:
+        if not (self.REQUIRED_SCOPES["users"] & scopes_set):
             missing_scopes.append("directory:read_users")
 
-        is_valid = len(missing_scopes) == 0
-        return is_valid, missing_scopes
+        return not missing_scopes, missing_scopes
 
     def get_resource_owner(self, public_url: str) -> Tuple[int, int]:
         """
@@ -111,33 +167,33 @@ class YandexAPIClient:
         Raises:
             YandexAPIError: При ошибке запроса или если владелец не найден
         """
+        cached = self._owner_cache.get(public_url)
+        if cached is not None:
+            return cached
+
         url = f"{self.DISK_API_BASE}/v1/disk/public/resources/admin/public-settings"
-        
-        # URL-encode публичного ключа
-        encoded_key = quote(public_url, safe='')
-        
-        params = {"public_key": encoded_key}
+
+        # httpx сам percent-кодирует значение ровно один раз
+        # при сборке строки запроса
+        params = {"public_key": public_url}
 
         try:
-            response = self.session.get(url, params=params)
-            response.raise_for_status()
-            data = response.json()
-
-            # Ищем владельца в списке accesses
-            accesses = data.get("accesses", [])
-            for access in accesses:
-                if access.get("type") == "owner":
-                    owner_uid = access.get("id")
-                    org_id = access.get("org_id")
-                    
-                    if owner_uid is None or org_id is None:
-                        raise YandexAPIError("Владелец найден, но данные неполные")
-                    
-                    return int(owner_uid), int(org_id)
-
-            raise YandexAPIError("Владелец ресурса не найден в данных о доступе")
-
-        except requests.exceptions.HTTPError as e:
+            owner = self._fetch_owner_access(url, params)
+
+            if owner is None:
+                raise YandexAPIError("Владелец ресурса не найден в данных о доступе")
+
+            owner_uid = owner.get("id")
+            org_id = owner.get("org_id")
+
+            if owner_uid is None or org_id is None:
+                raise YandexAPIError("Владелец найден, но данные неполные")
+
+            result = (int(owner_uid), int(org_id))
+            self._cache_put(self._owner_cache, public_url, result)
+            return result
+
+        except httpx.HTTPStatusError as e:
             if e.response.status_code == 404:
                 raise YandexAPIError("Публичный ресурс не найден или не принадлежит вашей организации")
             elif e.response.status_code == 403:
@@ -146,8 +202,49 @@ class YandexAPIClient:
                 raise YandexAPIError("Неверный токен авторизации")
             else:
                 raise YandexAPIError(f"Ошибка HTTP {e.response.status_code}: {e}")
-        except requests.exceptions.RequestException as e:
+        except httpx.RequestError as e:
             raise YandexAPIError(f"Ошибка при получении информации о ресурсе: {e}")
+        except _JSON_DECODE_ERRORS as e:
+            raise YandexAPIError(f"Некорректный JSON в ответе о ресурсе: {e}")
+
+    def _fetch_owner_access(self, url: str, params: Dict) -> Optional[Dict]:
+        """
+        Запрашивает public-settings и возвращает запись владельца из accesses.
+
+        При наличии ijson ответ разбирается потоково: чтение прерывается
+        на первой записи владельца, не строя всё дерево JSON в памяти.
+
+        Args:
+            url: URL эндпоинта public-settings
+            params: Параметры запроса
+
+        Returns:
+            Словарь записи владельца или None, если владелец не найден
+        """
+        if ijson is not None:
+            for attempt in range(self.RETRY_TOTAL + 1):
+                with self._client.stream("GET", url, params=params) as response:
+                    if (response.status_code in self.RETRY_STATUSES
+                            and attempt < self.RETRY_TOTAL):
+                        time.sleep(self.RETRY_BACKOFF * (2 ** attempt))
+                        continue
+
+                    response.raise_for_status()
+                    for access in ijson.items(
+                        _ChunkReader(response.iter_bytes()), "accesses.item"
+                    ):
+                        if access.get("type") == "owner":
+                            return access
+                return None
+
+        response = self._get_with_retry(url, params=params)
+        response.raise_for_status()
+        data = orjson.loads(response.content)
+
+        for access in data.get("accesses", []):
+            if access.get("type") == "owner":
+                return access
+        return None
 
     def get_user_info(self, org_id: int, user_id: int) -> Dict:
         """
@@ -169,14 +266,21 @@ class YandexAPIClient:
         Raises:
             YandexAPIError: При ошибке запроса
         """
+        key = (org_id, user_id)
+        cached = self._user_cache.get(key)
+        if cached is not None:
+            return cached
+
         url = f"{self.DIRECTORY_API_BASE}/directory/v1/org/{org_id}/users/{user_id}"
 
         try:
-            response = self.session.get(url)
+            response = self._get_with_retry(url)
             response.raise_for_status()
-            return response.json()
+            user_data = orjson.loads(response.content)
+            self._cache_put(self._user_cache, key, user_data)
+            return user_data
 
-        except requests.exceptions.HTTPError as e:
+        except httpx.HTTPStatusError as e:
             if e.response.status_code == 404:
                 raise YandexAPIError(f"Пользователь с ID {user_id} не найден в организации {org_id}")
             elif e.response.status_code == 403:
@@ -185,9 +289,126 @@ class YandexAPIClient:
                 raise YandexAPIError("Неверный токен авторизации")
             else:
                 raise YandexAPIError(f"Ошибка HTTP {e.response.status_code}: {e}")
-        except requests.exceptions.RequestException as e:
+        except httpx.RequestError as e:
             raise YandexAPIError(f"Ошибка при получении информации о пользователе: {e}")
+        except _JSON_DECODE_ERRORS as e:
+            raise YandexAPIError(f"Некорректный JSON в данных пользователя: {e}")
+
+    def get_users_bulk(
+        self, org_id: int, user_ids: List[int]
+    ) -> Tuple[Dict[int, Dict], Dict[int, str]]:
+        """
+        Получает информацию о нескольких пользователях за минимум запросов.
+
+        Сначала пытается использовать списочный эндпоинт Directory API
+        с фильтром по id (один запрос на всю пачку); пользователей,
+        которых эндпоинт не вернул, дозапрашивает по одному.
+
+        Args:
+            org_id: Идентификатор организации
+            user_ids: Список идентификаторов пользователей (UID)
+
+        Returns:
+            Кортеж (users, errors): словарь {user_id: user_data} и словарь
+            {user_id: текст ошибки} для тех, кого получить не удалось
+        """
+        wanted = set(user_ids)
+        result: Dict[int, Dict] = {}
+        errors: Dict[int, str] = {}
+
+        # Сначала отдаём то, что уже есть в кэше
+        for uid in list(wanted):
+            cached = self._user_cache.get((org_id, uid))
+            if cached is not None:
+                result[uid] = cached
+                wanted.discard(uid)
+
+        if not wanted:
+            return result, errors
+
+        if len(wanted) > 1:
+            url = f"{self.DIRECTORY_API_BASE}/directory/v1/org/{org_id}/users"
+            params = {
+                "perPage": 100,
+                "id": ",".join(str(uid) for uid in sorted(wanted)),
+            }
+
+            try:
+                response = self._get_with_retry(url, params=params)
+                response.raise_for_status()
+                data = orjson.loads(response.content)
+
+                for user_data in data.get("users", []):
+                    uid = user_data.get("id")
+                    if uid is None:
+                        continue
+                    uid = int(uid)
+                    if uid in wanted:
+                        result[uid] = user_data
+                        self._cache_put(self._user_cache, (org_id, uid), user_data)
+                        wanted.discard(uid)
+            except (httpx.HTTPError,) + _JSON_DECODE_ERRORS:
+                # Эндпоинт недоступен, не поддерживает фильтр по id
+                # или вернул некорректный JSON — переходим на одиночные запросы
+                pass
+
+        # Добираем недостающих по одному; реальную причину отказа
+        # (404, нехватка прав и т.д.) сохраняем для вызывающего кода
+        for uid in wanted:
+            try:
+                result[uid] = self.get_user_info(org_id, uid)
+            except YandexAPIError as e:
+                errors[uid] = str(e)
+
+        return result, errors
+
+    def warmup_disk_connection(self) -> None:
+        """
+        Прогревает соединение с Disk API в фоновом потоке.
+
+        TCP/TLS-рукопожатие выполняется заранее, и к моменту первого
+        реального запроса соединение уже лежит в пуле keep-alive.
+        """
+        def _connect():
+            try:
+                self._client.head(f"{self.DISK_API_BASE}/v1/disk/", timeout=5)
+            except httpx.RequestError:
+                # Прогрев необязателен — ошибки игнорируем
+                pass
+
+        threading.Thread(target=_connect, daemon=True).start()
+
+    def _get_with_retry(self, url: str, params: Optional[Dict] = None) -> httpx.Response:
+        """
+        Выполняет GET с повтором при ответах 502/503/504.
+
+        Args:
+            url: URL запроса
+            params: Параметры запроса
+
+        Returns:
+            Ответ сервера (последний, если повторы исчерпаны)
+        """
+        for attempt in range(self.RETRY_TOTAL):
+            response = self._client.get(url, params=params)
+            if response.status_code not in self.RETRY_STATUSES:
+                return response
+            time.sleep(self.RETRY_BACKOFF * (2 ** attempt))
+        return self._client.get(url, params=params)
+
+    def _cache_put(self, cache: Dict, key, value) -> None:
+        """
+        Кладёт значение в кэш, вытесняя самую старую запись при переполнении.
+
+        Args:
+            cache: Словарь-кэш (словари сохраняют порядок вставки)
+            key: Ключ кэша
+            value: Кэшируемое значение
+        """
+        if len(cache) >= self.MAX_CACHE_SIZE:
+            cache.pop(next(iter(cache)))
+        cache[key] = value
 
     def close(self):
-        """Закрывает сессию."""
-        self.session.close()
+        """Закрывает клиент и его пул соединений."""
+        self._client.close()
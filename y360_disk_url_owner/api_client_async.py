@@ -0,0 +1,150 @@
+"""
+Асинхронный клиент для работы с Яндекс 360 API.
+Использует httpx.AsyncClient (HTTP/2, постоянный пул соединений), что позволяет
+выполнять массовые запросы конкурентно через asyncio.gather.
+Для интерактивного режима остаётся синхронный клиент из api_client.
+"""
+
+import asyncio
+from typing import Dict, List, Optional, Tuple
+
+import httpx
+import orjson
+
+from .api_client import YandexAPIError
+from .url_parser import URLParseError, normalize_url
+
+
+class AsyncYandexAPIClient:
+    """Асинхронный клиент для работы с Яндекс 360 API."""
+
+    # Базовые URL для API
+    DIRECTORY_API_BASE = "https://api360.yandex.net"
+    DISK_API_BASE = "https://cloud-api.yandex.net"
+
+    def __init__(self, token: str):
+        """
+        Инициализация клиента.
+
+        Args:
+            token: OAuth токен для доступа к API
+        """
+        self.token = token
+        self._client = httpx.AsyncClient(
+            http2=True,
+            headers={
+                "Authorization": f"OAuth {token}",
+                "Content-Type": "application/json",
+            },
+            timeout=30.0,
+            limits=httpx.Limits(max_connections=20, max_keepalive_connections=20),
+        )
+
+    async def get_resource_owner(self, public_url: str) -> Tuple[int, int]:
+        """
+        Получает владельца публичного ресурса по URL.
+
+        Args:
+            public_url: Публичная ссылка на ресурс (может быть в любом формате)
+
+        Returns:
+            Кортеж (owner_uid, org_id)
+
+        Raises:
+            YandexAPIError: При ошибке запроса или если владелец не найден
+        """
+        url = f"{self.DISK_API_BASE}/v1/disk/public/resources/admin/public-settings"
+        params = {"public_key": public_url}
+
+        try:
+            response = await self._client.get(url, params=params)
+            response.raise_for_status()
+            data = orjson.loads(response.content)
+
+            # Ищем владельца в списке accesses
+            for access in data.get("accesses", []):
+                if access.get("type") == "owner":
+                    owner_uid = access.get("id")
+                    org_id = access.get("org_id")
+
+                    if owner_uid is None or org_id is None:
+                        raise YandexAPIError("Владелец найден, но данные неполные")
+
+                    return int(owner_uid), int(org_id)
+
+            raise YandexAPIError("Владелец ресурса не найден в данных о доступе")
+
+        except httpx.HTTPStatusError as e:
+            if e.response.status_code == 404:
+                raise YandexAPIError("Публичный ресурс не найден или не принадлежит вашей организации")
+            elif e.response.status_code == 403:
+                raise YandexAPIError("Недостаточно прав для доступа к информации о ресурсе")
+            elif e.response.status_code == 401:
+                raise YandexAPIError("Неверный токен авторизации")
+            else:
+                raise YandexAPIError(f"Ошибка HTTP {e.response.status_code}: {e}")
+        except httpx.RequestError as e:
+            raise YandexAPIError(f"Ошибка при получении информации о ресурсе: {e}")
+        except orjson.JSONDecodeError as e:
+            raise YandexAPIError(f"Некорректный JSON в ответе о ресурсе: {e}")
+
+    async def get_user_info(self, org_id: int, user_id: int) -> Dict:
+        """
+        Получает информацию о пользователе.
+
+        Args:
+            org_id: Идентификатор организации
+            user_id: Идентификатор пользователя (UID)
+
+        Returns:
+            Словарь с информацией о пользователе
+
+        Raises:
+            YandexAPIError: При ошибке запроса
+        """
+        url = f"{self.DIRECTORY_API_BASE}/directory/v1/org/{org_id}/users/{user_id}"
+
+        try:
+            response = await self._client.get(url)
+            response.raise_for_status()
+            return orjson.loads(response.content)
+
+        except httpx.HTTPStatusError as e:
+            if e.response.status_code == 404:
+                raise YandexAPIError(f"Пользователь с ID {user_id} не найден в организации {org_id}")
+            elif e.response.status_code == 403:
+                raise YandexAPIError("Недостаточно прав для получения информации о пользователе")
+            elif e.response.status_code == 401:
+                raise YandexAPIError("Неверный токен авторизации")
+            else:
+                raise YandexAPIError(f"Ошибка HTTP {e.response.status_code}: {e}")
+        except httpx.RequestError as e:
+            raise YandexAPIError(f"Ошибка при получении информации о пользователе: {e}")
+        except orjson.JSONDecodeError as e:
+            raise YandexAPIError(f"Некорректный JSON в данных пользователя: {e}")
+
+    async def batch_lookup(self, urls: List[str]) -> List[Tuple[str, Optional[Dict], Optional[str]]]:
+        """
+        Конкурентно определяет владельцев для списка URL.
+
+        Args:
+            urls: Список URL в любом из поддерживаемых форматов
+
+        Returns:
+            Список кортежей (url, user_data, error) в порядке исходного списка;
+            при успехе error равен None, при ошибке user_data равен None
+        """
+        return list(await asyncio.gather(*(self._lookup_one(url) for url in urls)))
+
+    async def _lookup_one(self, url: str) -> Tuple[str, Optional[Dict], Optional[str]]:
+        """Полный цикл определения владельца для одного URL."""
+        try:
+            owner_uid, org_id = await self.get_resource_owner(normalize_url(url))
+            user_data = await self.get_user_info(org_id, owner_uid)
+            return url, user_data, None
+        except (URLParseError, YandexAPIError) as e:
+            return url, None, str(e)
+
+    async def aclose(self):
+        """Закрывает клиент и его пул соединений."""
+        await self._client.aclose()
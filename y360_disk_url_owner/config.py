@@ -7,8 +7,6 @@ import os
 from pathlib import Path
 from typing import Optional, Tuple
 
-from dotenv import load_dotenv, set_key
-
 
 class ConfigManager:
     """Управление конфигурационными параметрами приложения."""
@@ -17,6 +15,8 @@ class ConfigManager:
         """Инициализация менеджера конфигурации."""
         self.config_dir = Path.home() / ".y360_disk_owner"
         self.env_file = self.config_dir / ".env"
+        # Кэш последней маскировки токена: (токен, маска)
+        self._masked_cache: Optional[Tuple[str, str]] = None
 
     def exists(self) -> bool:
         """
@@ -37,11 +37,21 @@ class ConfigManager:
         if not self.exists():
             return None, None
 
-        load_dotenv(self.env_file)
-        token = os.getenv("API_TOKEN")
-        org_id = os.getenv("ORG_ID")
-
-        return token, org_id
+        # Разбираем файл напрямую: для двух ключей полный парсер dotenv
+        # не нужен, и os.environ остаётся нетронутым
+        data = {}
+        for line in self.env_file.read_text(encoding="utf-8").splitlines():
+            if '=' not in line or line.lstrip().startswith('#'):
+                continue
+            key, _, value = line.partition('=')
+            value = value.strip()
+            # Снимаем только парные обрамляющие кавычки,
+            # не трогая кавычки внутри значения
+            if len(value) >= 2 and value[0] == value[-1] and value[0] in '"\'':
+                value = value[1:-1]
+            data[key.strip()] = value
+
+        return data.get("API_TOKEN"), data.get("ORG_ID")
 
     def save(self, token: str, org_id: str) -> None:
         """
@@ -58,9 +68,12 @@ class ConfigManager:
         if not self.env_file.exists():
             self.env_file.touch(mode=0o600)  # Создаем с ограниченными правами
 
-        # Сохраняем параметры
-        set_key(self.env_file, "API_TOKEN", token)
-        set_key(self.env_file, "ORG_ID", org_id)
+        # Пишем значения как есть, без кавычек и экранирования —
+        # зеркально разбору в load()
+        self.env_file.write_text(
+            f"API_TOKEN={token}\nORG_ID={org_id}\n",
+            encoding="utf-8",
+        )
 
         # Устанавливаем права доступа только для владельца
         os.chmod(self.env_file, 0o600)
@@ -78,11 +91,18 @@ class ConfigManager:
         if not token or len(token) < 12:
             return "***"
 
+        # Маска для одного и того же токена запрашивается многократно —
+        # пересчитываем только при смене токена
+        if self._masked_cache is not None and self._masked_cache[0] == token:
+            return self._masked_cache[1]
+
         # Показываем первые 9 символов и последние 4
         prefix = token[:9] if len(token) > 9 else token[:3]
         suffix = token[-4:] if len(token) > 4 else ""
 
-        return f"{prefix}...{suffix}"
+        masked = f"{prefix}...{suffix}"
+        self._masked_cache = (token, masked)
+        return masked
 
     def delete(self) -> None:
         """Удаляет файл конфигурации."""
@@ -4,7 +4,8 @@
 """
 
 import sys
-from typing import Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Dict, List, Optional, Tuple
 
 from .api_client import YandexAPIClient, YandexAPIError
 from .config import ConfigManager
@@ -69,6 +70,7 @@ class Application:
                 if choice == "1":
                     # Продолжаем с текущими настройками
                     self.api_client = YandexAPIClient(token)
+                    self.api_client.warmup_disk_connection()
                     return True
                 elif choice == "2":
                     # Изменяем настройки
@@ -132,14 +134,19 @@ class Application:
                 # Сохраняем конфигурацию
                 self.config.save(token, org_id)
                 self.ui.show_config_saved()
-                
-                # Создаём API клиент
-                self.api_client = YandexAPIClient(token)
-                temp_client.close()
-                
+
+                # Используем уже проверенный клиент как основной:
+                # его соединение с API уже установлено
+                self.api_client = temp_client
+
+                # Заранее прогреваем соединение с Disk API,
+                # чтобы скрыть TLS-задержку первого запроса
+                self.api_client.warmup_disk_connection()
+
                 return True
 
             except YandexAPIError as e:
+                temp_client.close()
                 self.ui.show_error(f"Ошибка проверки токена: {e}")
                 self.ui.show_warning("Попробуйте ввести данные ещё раз")
                 continue
@@ -189,10 +196,7 @@ class Application:
             owner_uid, resource_org_id = self.api_client.get_resource_owner(normalized_url)
             self.ui.clear_processing()
 
-            # Получаем org_id из конфигурации
-            _, config_org_id = self.config.load()
-            
-            # Используем org_id из ресурса (он более точный)
+            # Используем org_id из ресурса (он более точный, чем из конфигурации)
             org_id_to_use = resource_org_id
 
             # Получаем информацию о пользователе
@@ -213,6 +217,81 @@ class Application:
             self.ui.clear_processing()
             self.ui.show_error(f"Непредвиденная ошибка: {e}")
 
+    def process_urls(self, urls: List[str]) -> List[Tuple[str, Optional[Dict], Optional[str]]]:
+        """
+        Обрабатывает список URL в пакетном режиме.
+
+        Работает в две фазы: сначала владельцы всех ресурсов определяются
+        конкурентно через пул потоков, затем найденные владельцы
+        группируются по организациям и данные пользователей запрашиваются
+        пакетно — одним запросом на организацию.
+
+        Args:
+            urls: Список URL для обработки
+
+        Returns:
+            Список кортежей (url, user_data, error) в порядке исходного списка;
+            при успехе error равен None, при ошибке user_data равен None
+        """
+        results: List[Optional[Tuple[str, Optional[Dict], Optional[str]]]] = [None] * len(urls)
+
+        def lookup_owner(url: str) -> Tuple[int, int]:
+            return self.api_client.get_resource_owner(normalize_url(url))
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            # Этап 1: определяем владельца каждого ресурса
+            owner_futures = {
+                executor.submit(lookup_owner, url): index
+                for index, url in enumerate(urls)
+            }
+
+            # Этап 2: группируем владельцев по организациям и запрашиваем
+            # данные пользователей пакетно — один запрос на организацию
+            pending: Dict[int, List[Tuple[int, int]]] = {}
+            for future in as_completed(owner_futures):
+                index = owner_futures[future]
+                try:
+                    owner_uid, org_id = future.result()
+                except (URLParseError, YandexAPIError) as e:
+                    results[index] = (urls[index], None, str(e))
+                    continue
+
+                pending.setdefault(org_id, []).append((index, owner_uid))
+
+            bulk_futures = {
+                executor.submit(
+                    self.api_client.get_users_bulk,
+                    org_id,
+                    [uid for _, uid in entries],
+                ): (org_id, entries)
+                for org_id, entries in pending.items()
+            }
+
+            for future in as_completed(bulk_futures):
+                org_id, entries = bulk_futures[future]
+                try:
+                    users, user_errors = future.result()
+                except YandexAPIError as e:
+                    for index, _ in entries:
+                        results[index] = (urls[index], None, str(e))
+                    continue
+
+                for index, uid in entries:
+                    user_data = users.get(uid)
+                    if user_data is not None:
+                        results[index] = (urls[index], user_data, None)
+                    else:
+                        results[index] = (
+                            urls[index],
+                            None,
+                            user_errors.get(
+                                uid,
+                                f"Пользователь с ID {uid} не найден в организации {org_id}",
+                            ),
+                        )
+
+        return results
+
 
 def main():
     """Entry point приложения."""
@@ -6,18 +6,24 @@
 import sys
 from typing import Dict, Optional
 
-from rich.console import Console
-from rich.panel import Panel
-from rich.prompt import Confirm, Prompt
-from rich.table import Table
-from rich.text import Text
-
 
 class UI:
     """Класс для управления пользовательским интерфейсом."""
 
     def __init__(self):
         """Инициализация UI."""
+        # rich импортируется лениво: при использовании пакета как библиотеки
+        # (без интерактивного UI) его дерево модулей не загружается вовсе
+        from rich.console import Console
+        from rich.panel import Panel
+        from rich.prompt import Prompt
+        from rich.table import Table
+        from rich.text import Text
+
+        self._Panel = Panel
+        self._Prompt = Prompt
+        self._Table = Table
+        self._Text = Text
         self.console = Console()
 
     def clear_screen(self):
@@ -27,12 +33,12 @@ class UI:
     def show_welcome(self):
         """Показывает приветственное сообщение."""
         self.console.print()
-        welcome_text = Text()
+        welcome_text = self._Text()
         welcome_text.append("Добро пожаловать в ", style="bold cyan")
         welcome_text.append("Y360 Disk URL Owner", style="bold yellow")
         welcome_text.append("!", style="bold cyan")
         
-        panel = Panel(
+        panel = self._Panel(
             welcome_text,
             title="🔍 Поиск владельца файла на Яндекс Диске",
             border_style="cyan",
@@ -69,7 +75,7 @@ class UI:
         self.console.print()
 
         while True:
-            choice = Prompt.ask("Ваш выбор", choices=["1", "2", "3"], default="1")
+            choice = self._Prompt.ask("Ваш выбор", choices=["1", "2", "3"], default="1")
             return choice
 
     def prompt_token(self) -> str:
@@ -83,7 +89,7 @@ class UI:
         self.console.print("[yellow]Введите OAuth токен для доступа к Яндекс 360 API[/yellow]")
         self.console.print()
         
-        token = Prompt.ask("Token")
+        token = self._Prompt.ask("Token")
         return token.strip()
 
     def prompt_org_id(self) -> str:
@@ -95,7 +101,7 @@ class UI:
         """
         self.console.print()
         self.console.print("[yellow]Введите ID организации (org_id)[/yellow]")
-        org_id = Prompt.ask("Organization ID")
+        org_id = self._Prompt.ask("Organization ID")
         return org_id.strip()
 
     def show_token_info(self, login: str):
@@ -145,7 +151,7 @@ class UI:
             "[dim]Для вставки используйте Ctrl+V (Cmd+V на macOS)\n"
             "Для выхода введите 'q' или 'quit'[/dim]"
         )
-        panel = Panel(instructions, border_style="blue", padding=(1, 2))
+        panel = self._Panel(instructions, border_style="blue", padding=(1, 2))
         self.console.print(panel)
         self.console.print()
 
@@ -156,7 +162,7 @@ class UI:
         Returns:
             Введённый URL или None если пользователь хочет выйти
         """
-        url = Prompt.ask("[bold]URL")
+        url = self._Prompt.ask("[bold]URL")
         url = url.strip()
         
         if url.lower() in ['q', 'quit', 'exit']:
@@ -188,7 +194,7 @@ class UI:
         self.console.print()
 
         # Создаём таблицу
-        table = Table(show_header=False, box=None, padding=(0, 2))
+        table = self._Table(show_header=False, box=None, padding=(0, 2))
         table.add_column("Поле", style="cyan", no_wrap=True)
         table.add_column("Значение", style="white")
 
@@ -208,7 +214,7 @@ class UI:
             table.add_row("Фамилия", last_name)
 
         # Выводим таблицу в панели
-        panel = Panel(table, border_style="green", padding=(1, 2))
+        panel = self._Panel(table, border_style="green", padding=(1, 2))
         self.console.print(panel)
         self.console.print()
 
@@ -255,4 +261,4 @@ class UI:
     def pause(self):
         """Пауза с ожиданием нажатия Enter."""
         self.console.print()
-        Prompt.ask("[dim]Нажмите Enter для продолжения[/dim]", default="")
+        self._Prompt.ask("[dim]Нажмите Enter для продолжения[/dim]", default="")
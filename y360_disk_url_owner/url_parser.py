@@ -9,6 +9,38 @@
 import re
 from urllib.parse import parse_qs, unquote, urlparse
 
+# Скомпилированные паттерны (компилируются один раз при загрузке модуля)
+_SHORT_RE = re.compile(r'https?://disk\.yandex\.ru/d/[a-zA-Z0-9\-]+/?.*$')
+
+# Префиксы короткой ссылки: startswith по кортежу — байтовое сравнение
+# на уровне C, без регулярного выражения
+_SHORT_PREFIXES = (
+    'https://disk.yandex.ru/d/',
+    'http://disk.yandex.ru/d/',
+)
+
+# Допустимые символы хеша: translate с таблицей-удалением выбрасывает их
+# за один проход на уровне C, посторонние байты остаются в результате
+_HASH_ALLOWED = b'abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789+/'
+
+
+def _is_hash(s: str) -> bool:
+    """
+    Проверяет, похожа ли строка на хеш публичной ссылки
+    (символы base64, '=' допустим только в конце).
+    """
+    # Отрезаем набивку '=' — она разрешена только в конце строки
+    core = s.rstrip('=')
+    if not core:
+        return False
+
+    try:
+        encoded = core.encode('ascii')
+    except UnicodeEncodeError:
+        return False
+
+    return encoded.translate(None, _HASH_ALLOWED) == b''
+
 
 class URLParseError(Exception):
     """Исключение при ошибке парсинга URL."""
@@ -36,39 +68,42 @@ def normalize_url(url: str) -> str:
 
     # Пытаемся определить тип URL
     # 1. Проверяем короткую ссылку: https://disk.yandex.ru/d/...
-    short_pattern = r'https?://disk\.yandex\.ru/d/([a-zA-Z0-9\-]+)'
-    short_match = re.match(short_pattern, url)
-    if short_match:
+    # (паттерн принимает и хвостовые суффиксы после токена)
+    if _SHORT_RE.match(url):
         # Короткая ссылка валидна, возвращаем её как есть
         return url
 
     # 2. Проверяем полную ссылку: https://disk.yandex.ru/public/?hash=...
     if url.startswith('http'):
+        # Быстрый путь: ссылка уже в каноническом виде, hash извлекается
+        # строковыми операциями без полного разбора через urlparse
+        # (значение обрезается и по '&', и по '#' — фрагмент не часть хеша)
+        if url.startswith(('https://disk.yandex.ru/public/?hash=',
+                           'http://disk.yandex.ru/public/?hash=')):
+            raw_value = url.partition('hash=')[2].partition('&')[0].partition('#')[0]
+            if raw_value:
+                return f"https://disk.yandex.ru/public/?hash={unquote(raw_value)}"
+
         parsed = urlparse(url)
         
         # Проверяем, что это disk.yandex.ru
         if 'disk.yandex.ru' not in parsed.netloc:
             raise URLParseError(f"URL не является ссылкой на Яндекс Диск: {parsed.netloc}")
         
-        # Пытаемся извлечь hash из параметров
-        query_params = parse_qs(parsed.query)
-        if 'hash' in query_params:
-            hash_value = query_params['hash'][0]
-            # Декодируем если нужно
-            hash_value = unquote(hash_value)
-            # Возвращаем полный URL с хешем
-            return f"https://disk.yandex.ru/public/?hash={hash_value}"
-        
-        # Если это /d/ ссылка без совпадения с паттерном выше
-        if '/d/' in parsed.path:
-            return url
-        
+        # Пытаемся извлечь hash из параметров — с той же семантикой,
+        # что и быстрый путь: одно декодирование, '+' сохраняется как есть
+        for pair in parsed.query.split('&'):
+            key, _, value = pair.partition('=')
+            if key == 'hash' and value:
+                # Возвращаем полный URL с хешем
+                return f"https://disk.yandex.ru/public/?hash={unquote(value)}"
+
+        # Короткие ссылки /d/ уже обработаны паттерном выше
         raise URLParseError("URL не содержит параметр hash или корректный путь /d/")
 
     # 3. Предполагаем, что это просто хеш
     # Хеш может содержать буквы, цифры, +, /, =
-    hash_pattern = r'^[a-zA-Z0-9+/]+=*$'
-    if re.match(hash_pattern, url):
+    if _is_hash(url):
         # Это похоже на хеш, возвращаем его как есть
         # API примет его напрямую
         return url
@@ -111,7 +146,7 @@ def get_url_type(url: str) -> str:
     url = url.strip()
 
     # Короткая ссылка
-    if re.match(r'https?://disk\.yandex\.ru/d/', url):
+    if url.startswith(_SHORT_PREFIXES):
         return "short"
 
     # Полная ссылка
@@ -123,8 +158,7 @@ def get_url_type(url: str) -> str:
                 return "full"
 
     # Хеш
-    hash_pattern = r'^[a-zA-Z0-9+/]+=*$'
-    if re.match(hash_pattern, url):
+    if _is_hash(url):
         return "hash"
 
     return "unknown"